@@ -14,7 +14,7 @@ from heapq import heappop, heappush  # for priority queue
 
 from pythainlp.tokenize import DEFAULT_DICT_TRIE
 
-from .tcc import tcc_pos
+from .tcc import tcc_boundary_iter
 
 # ช่วยตัดพวกภาษาอังกฤษ เป็นต้น
 PAT_ENG = re.compile(
@@ -42,7 +42,7 @@ def bfs_paths_graph(graph, start, goal):
 
 def onecut(text, trie):
     graph = defaultdict(list)  # main data structure
-    allow_pos = tcc_pos(text)  # ตำแหน่งที่ตัด ต้องตรงกับ tcc
+    allow_pos = set(tcc_boundary_iter(text))  # ตำแหน่งที่ตัด ต้องตรงกับ tcc
 
     q = [0]  # min-heap queue
     last_p = 0  # last position for yield
@@ -67,15 +67,15 @@ def onecut(text, trie):
 
         # กรณี length 0 คือ ไม่มีใน dict
         if len(q) == 0:
-            m = PAT_ENG.match(text[p:])
+            m = PAT_ENG.match(text, p)
             if m:  # อังกฤษ, เลข, ว่าง
-                i = p + m.end()
+                i = m.end()
             else:  # skip น้อยที่สุด ที่เป็นไปได้
                 for i in range(p + 1, len(text)):
                     if i in allow_pos:  # ใช้ tcc ด้วย
                         ww = [w for w in trie.prefixes(text[i:]) if (i + len(w) in allow_pos)]
                         ww = [w for w in ww if not PAT_TWOCHARS.match(w)]
-                        m = PAT_ENG.match(text[i:])
+                        m = PAT_ENG.match(text, i)
                         if ww or m:
                             break
                 else:
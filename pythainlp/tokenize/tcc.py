@@ -14,6 +14,25 @@ Credits:
 - Python code: Korakot Chaovavanich
 """
 
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2: ไม่มี cache
+
+    def lru_cache(maxsize=128):
+        return lambda f: f
+
+try:
+    from itertools import accumulate
+except ImportError:  # Python 2
+
+    def accumulate(iterable):
+        total = 0
+        for x in iterable:
+            total += x
+            yield total
+
+# ลำดับของ pattern มีผลต่อผลลัพธ์: alternation เลือก pattern แรกที่ตรง (leftmost-first)
+# ไม่ใช่ pattern ที่ยาวที่สุด ห้ามเรียงใหม่
 RE_TCC = (
     """\
 เc็c
@@ -47,32 +66,65 @@ ct[ะาำ]?
     .split()
 )
 
-PAT_TCC = re.compile("|".join(RE_TCC))
+_RE_TCC_SRC = "|".join(RE_TCC)
+
+PAT_TCC = re.compile(_RE_TCC_SRC)
+
+# ต่อท้ายด้วย . (รวม newline) ให้ทุกตำแหน่งมี match เสมอ เหมือนกรณีตัดทีละ 1 อักขระ
+# เมื่อไม่ตรง pattern ใด finditer จึงเดินทั้งสตริงใน C ได้ในรอบเดียว
+# คอมไพล์เมื่อเรียกใช้ครั้งแรก ไม่ใช่ตอน import
+_PAT = None
+
+
+def _pat():
+    global _PAT
+    if _PAT is None:
+        _PAT = re.compile(_RE_TCC_SRC + "|.", re.DOTALL)
+    return _PAT
+
+
+def tcc_boundary_iter(w):
+    """
+    คืนตำแหน่งท้ายของแต่ละ TCC ใน w ทีละตำแหน่ง (ไม่สร้าง substring)
+    """
+    return (m.end() for m in _pat().finditer(w))
 
 
 def tcc_gen(w):
-    p = 0
-    while p < len(w):
-        m = PAT_TCC.match(w[p:])
-        if m:
-            n = m.span()[1]
-        else:
-            n = 1
-        yield w[p : p + n]
-        p += n
+    return (m.group() for m in _pat().finditer(w))
+
+
+# คำ/พยางค์เดิมถูกส่งมาซ้ำบ่อย เก็บผลไว้ใน cache
+# เฉพาะสตริงสั้น สตริงยาว (เช่นทั้งเอกสาร) ตัดตรง ๆ ไม่เก็บ
+_CACHE_MAX_LEN = 64
+
+
+@lru_cache(maxsize=1 << 16)
+def _tcc_tuple_cached(w):
+    return tuple(_pat().findall(w))
+
+
+def _tcc_tuple(w):
+    if len(w) > _CACHE_MAX_LEN:
+        return tuple(_pat().findall(w))
+    return _tcc_tuple_cached(w)
 
 
 def tcc_pos(text):
-    p_set = set()
-    p = 0
-    for w in tcc_gen(text):
-        p += len(w)
-        p_set.add(p)
-    return p_set
+    return set(accumulate(map(len, _tcc_tuple(text))))
 
 
 def tcc(w, sep="/"):
-    return sep.join(tcc_gen(w))
+    return sep.join(_tcc_tuple(w))
+
+
+def tcc_batch(words):
+    """
+    TCC ของหลายคำพร้อมกัน คืนค่า list ของ list ของ TCC ตามลำดับคำ
+    (ไม่ใช้ cache ของ tcc เพื่อไม่ให้คำในชุดใหญ่ไล่คำที่ใช้บ่อยออก)
+    """
+    findall = _pat().findall
+    return [findall(w) for w in words]
 
 
 if __name__ == "__main__":
@@ -158,6 +158,27 @@ class TestUM(unittest.TestCase):
 
     def test_tcc(self):
         self.assertEqual(tcc.tcc('ประเทศไทย'), 'ป/ระ/เท/ศ/ไท/ย')
+        self.assertEqual(tcc.tcc('เรียน'), 'เรีย/น')
+        self.assertEqual(tcc.tcc('เรียะ'), 'เรียะ')
+        self.assertEqual(tcc.tcc_pos('แมวกิน'), {2, 3, 5, 6})
+        self.assertEqual(list(tcc.tcc_boundary_iter('แมวกิน')), [2, 3, 5, 6])
+        self.assertEqual(
+            tcc.tcc_batch(['แมวกิน', 'ยินดี']),
+            [['แม', 'ว', 'กิ', 'น'], ['ยิ', 'น', 'ดี']]
+        )
+
+    def test_tcc_pattern(self):
+        # ต้องให้ผลเหมือนการเรียก PAT_TCC.match ทีละตำแหน่ง ทุกคำ
+        def tcc_re(w):
+            p = 0
+            while p < len(w):
+                m = tcc.PAT_TCC.match(w, p)
+                n = m.end() - p if m else 1
+                yield w[p:p + n]
+                p += n
+
+        for w in thaiword.get_data() + ['เรีย\n', 'เรียน\n']:
+            self.assertEqual(list(tcc.tcc_gen(w)), list(tcc_re(w)))
 
     def test_isthai(self):
         self.assertEqual(isthai('ประเทศไทย'), {'thai': 100.0})